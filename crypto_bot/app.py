@@ -4,7 +4,8 @@ from chalice import Chalice, Cron
 from chalicelib import utils, trade_processing, trade_execution
 
 app = Chalice(app_name="crypto_bot")
-app.log.setLevel(logging.DEBUG)
+app.log.setLevel(os.environ.get("LOG_LEVEL", "DEBUG"))
+logging.getLogger("app").setLevel(app.log.level)
 
 # REST API Endpoint
 @app.route("/receive_trade_signals", methods=["POST"])
@@ -23,10 +24,10 @@ def receive_trade_signals():
 
         exchange = trade_execution.Exchange(exchange_name)
         exchange.connect(secret_name, sandbox=sandbox)
-        app.log.debug(f"Succesfully connected to exchange: {exchange_name}")
+        app.log.debug("Succesfully connected to exchange: %s", exchange_name)
 
         order = trade_execution.execute_long_stop(exchange, trade_out, increment_pct=0.001)
-        app.log.info(f"Successfully executed stop loss order: {order}")
+        app.log.info("Successfully executed stop loss order: %s", order)
     else:
         table_name = os.environ.get("TABLE_NAME")
         dynamodb_manager = utils.DynamoDBManager()
@@ -43,7 +44,7 @@ def execute_trade_signals(event):
     utcnow = utils.get_utc_now_rounded()
     trades = trade_processing.get_all_recent_signals(utcnow, table_name)
     if trades:
-        app.log.debug(f"Succesfully retrieved trade signals from database: {trades}")
+        app.log.debug("Succesfully retrieved trade signals from database: %s", trades)
 
         secret_name = os.environ.get("SECRET_NAME")
         exchange_name = os.environ.get("EXCHANGE_NAME")
@@ -51,10 +52,10 @@ def execute_trade_signals(event):
 
         exchange = trade_execution.Exchange(exchange_name)
         exchange.connect(secret_name, sandbox=sandbox)
-        app.log.debug(f"Succesfully connected to exchange: {exchange_name}")
+        app.log.debug("Succesfully connected to exchange: %s", exchange_name)
 
         orders = trade_execution.buy_side_boost(exchange, trades, increment_pct=0.001)
         if orders:
-            app.log.info(f"Successfully placed order(s): {orders}")
+            app.log.info("Successfully placed order(s): %s", orders)
     else:
-        app.log.info(f"No trade signals at {utcnow}")
\ No newline at end of file
+        app.log.info("No trade signals at %s", utcnow)
\ No newline at end of file
@@ -1,8 +1,11 @@
 import time
-from typing import List
+import logging
+from typing import List, Tuple
 from decimal import Decimal, ROUND_HALF_UP
 from chalicelib.exchanges import gemini
-from chalicelib import utils
+from chalicelib import utils, trade_processing
+
+logger = logging.getLogger("app")
 
 class Exchange:
     def __init__(self, exchange_name: str):
@@ -32,6 +35,55 @@ class Exchange:
         return self.client.get_total_usd()
     
 
+class _BalanceSnapshot:
+    """
+    Memoized view of the account allocation within a single execution run.
+
+    Args:
+        exchange (Exchange): An instance of the exchange.
+
+    Attributes:
+        allocation (dict): Cost in USD of each currency in the account.
+        total_value_usd (Decimal): Total account value in USD before unrealized gains.
+        quote_usd (Decimal): Available USD in the account.
+    """
+    def __init__(self, exchange: Exchange):
+        self.exchange = exchange
+        self.refresh()
+
+    def refresh(self):
+        """
+        Fetches the account allocation from the exchange.
+
+        Should only be called once the account changes, e.g. after a sell order fills.
+        """
+        self.allocation = self.exchange.get_account_allocation()
+        logger.debug("Account allocation: %s", self.allocation)
+        self.total_value_usd = sum(Decimal(str(value)) for value in self.allocation.values())
+        self.quote_usd = Decimal(str(self.allocation.get("USD", 0)))
+        self._pct_by_currency = {}
+
+    def pct(self, currency: str) -> Decimal:
+        """Get the proportion of the total account value allocated to currency."""
+        if currency not in self._pct_by_currency:
+            value = Decimal(str(self.allocation.get(currency)))
+            self._pct_by_currency[currency] = value / self.total_value_usd
+        return self._pct_by_currency[currency]
+
+
+def _price_multipliers(increment_pct: float=0) -> Tuple[Decimal, Decimal]:
+    """
+    Get the multipliers applied to the last price for buy and sell limit orders.
+
+    Args:
+        increment_pct: Percentage to increment order price by.  Defaults to 0.
+
+    Returns:
+        Tuple containing the buy and sell price multipliers.
+    """
+    price_adjustment = Decimal(str(increment_pct)).quantize(Decimal('0.0001'), rounding=ROUND_HALF_UP)
+    return 1 + price_adjustment, 1 - price_adjustment
+
 def multi_strategy_allocation(exchange: Exchange, trades: List[dict], increment_pct: float=0) -> List:
     """
     Allocates percentage of portfolio based on multiple strategies.
@@ -52,29 +104,29 @@ def multi_strategy_allocation(exchange: Exchange, trades: List[dict], increment_
         raise ValueError("Trades list is empty.")
 
     total_usd = exchange.get_total_usd()
+    buy_mult, sell_mult = _price_multipliers(increment_pct)
     orders = []
 
-    for trade in trades:
+    for trade in map(trade_processing.TradeSignal.from_dict, trades):
         
-        symbol = trade.get("symbol")
-        currency = trade.get("currency")
-        order_action = trade.get("order_action")
-        percentage = trade.get("percentage")
+        symbol = trade.symbol
+        currency = trade.currency
+        order_action = trade.order_action
+        percentage = trade.percentage
 
         if order_action not in ("buy", "sell"):
             raise ValueError(f"Invalid order action: {order_action}")
         
         last_price = exchange.get_last_price(symbol)
-        price_adjustment = Decimal(str(increment_pct)).quantize(Decimal('0.0001'), rounding=ROUND_HALF_UP)
         
         if order_action == "sell":
             sell_amount = exchange.get_total_currency(currency)
-            order_price = last_price - (last_price * price_adjustment)
+            order_price = last_price * sell_mult
             order = exchange.create_limit_order(symbol, order_action, sell_amount, order_price)
 
         elif order_action == "buy":
             allocated_usd = total_usd * percentage
-            order_price = last_price + (last_price * price_adjustment)
+            order_price = last_price * buy_mult
             position_size = allocated_usd / order_price
             order = exchange.create_limit_order(symbol, order_action, position_size, order_price)
         
@@ -98,18 +150,19 @@ def execute_long_stop(exchange: Exchange, trade: dict, increment_pct: float=0) -
     Returns:
         JSON representing order placed.
     """
-    symbol = trade.get("symbol")
-    currency = trade.get("currency")
-    order_action = trade.get("order_action")
+    trade = trade_processing.TradeSignal.from_dict(trade)
+    symbol = trade.symbol
+    currency = trade.currency
+    order_action = trade.order_action
     
     if order_action != "sell":
         raise ValueError(f"Invalid order action for long stop: {order_action}")
 
     last_price = exchange.get_last_price(symbol)
-    price_adjustment = Decimal(str(increment_pct)).quantize(Decimal('0.0001'), rounding=ROUND_HALF_UP)
+    _, sell_mult = _price_multipliers(increment_pct)
     
     sell_amount = exchange.get_total_currency(currency)
-    order_price = last_price - (last_price * price_adjustment)
+    order_price = last_price * sell_mult
     order = exchange.create_limit_order(symbol, order_action, sell_amount, order_price)
 
     return order
@@ -138,82 +191,75 @@ def buy_side_boost(exchange: Exchange, trades: List[dict], increment_pct: float=
     if not trades:
         raise ValueError("Trades list is empty.")
     
-    sell_signals = [trade for trade in trades if trade.get("order_action") == "sell"]
-    buy_signals = [trade for trade in trades if trade.get("order_action") == "buy"]
+    buy_mult, sell_mult = _price_multipliers(increment_pct)
+    sell_signals, buy_signals = [], []
+    for trade in trades:
+        signal = trade_processing.TradeSignal.from_dict(trade)
+        if signal.order_action == "sell":
+            sell_signals.append(signal)
+        elif signal.order_action == "buy":
+            buy_signals.append(signal)
 
     orders = []
     if sell_signals:
         for trade in sell_signals:
-            symbol = trade.get("symbol")
-            currency = trade.get("currency")
-            order_action = trade.get("order_action")
+            symbol = trade.symbol
+            currency = trade.currency
+            order_action = trade.order_action
 
             last_price = exchange.get_last_price(symbol)
-            price_adjustment = Decimal(str(increment_pct)).quantize(Decimal('0.0001'), rounding=ROUND_HALF_UP)
 
             sell_amount = exchange.get_total_currency(currency)
-            order_price = last_price - (last_price * price_adjustment)
+            order_price = last_price * sell_mult
             order = exchange.create_limit_order(symbol, order_action, sell_amount, order_price)
 
             orders.append(order)
 
     if buy_signals:
-        account_allocation_dict = exchange.get_account_allocation()
-        strategy_config = utils.get_strategy_config()
-
-        total_account_value_usd = Decimal(str(sum(account_allocation_dict.values())))
-        total_usd = Decimal(str(account_allocation_dict.get("USD", 0)))
+        snapshot = _BalanceSnapshot(exchange)
+        symbol_by_currency, pct_by_symbol = utils.build_symbol_indexes()
 
-        incoming_trade_symbols = [buy_signal.get("symbol") for buy_signal in buy_signals]
-        current_trade_symbols = [utils.get_symbol_from_currency(key) for key, value in account_allocation_dict.items() if key != "USD" and value > 0]
+        incoming_trade_symbols = [buy_signal.symbol for buy_signal in buy_signals]
+        current_trade_symbols = [symbol_by_currency.get(key) for key, value in snapshot.allocation.items() if key != "USD" and value > 0]
         all_trade_symbols = incoming_trade_symbols + current_trade_symbols
 
-        total_config_allocation_pct = sum([Decimal(str(strategy.get("percentage", 0))) for strategy in strategy_config.values()])
+        # Sets for membership tests, the lists keep the order trade precedence ties are broken on
+        incoming_symbol_set = set(incoming_trade_symbols)
+        current_symbol_set = set(current_trade_symbols)
+
+        total_config_allocation_pct = utils.get_total_allocation_pct()
         unallocated_pct = 1 - total_config_allocation_pct # Configured percentage not allocated to any strategy for fees & flexibility
 
-        incoming_trades_pct = sum([trade.get("percentage", 0) for trade in buy_signals])
-        current_trades_config_pct = sum([Decimal(str(utils.get_percentage_from_symbol(symbol))) for symbol in current_trade_symbols])
+        current_config_pct_by_symbol = {symbol: pct_by_symbol.get(symbol, 0) for symbol in current_trade_symbols}
+
+        incoming_trades_pct = sum(trade.percentage for trade in buy_signals)
+        current_trades_config_pct = sum(current_config_pct_by_symbol.values())
 
         available_pct = total_config_allocation_pct - incoming_trades_pct - current_trades_config_pct 
-        available_usd_pct = round(total_usd / total_account_value_usd, 4)
+        available_usd_pct = round(snapshot.quote_usd / snapshot.total_value_usd, 4)
 
         trade_precedence_symbol = utils.get_trade_precedence(all_trade_symbols)
 
         # If active trades, reallocate funds to incoming trades, prioritizing the symbol with trade precedence.
         if current_trade_symbols:
             # Partially allocated account and trade precedence symbol stays in current trades
-            if (trade_precedence_symbol in current_trade_symbols) & (incoming_trades_pct <= available_usd_pct):
-                for trade in buy_signals:
-                    symbol = trade.get("symbol")
-                    currency = trade.get("currency")
-                    order_action = trade.get("order_action")
-                    percentage = trade.get("percentage")
-
-                    last_price = exchange.get_last_price(symbol)
-                    price_adjustment = Decimal(str(increment_pct)).quantize(Decimal('0.0001'), rounding=ROUND_HALF_UP)
-
-                    allocated_usd = total_account_value_usd * percentage
-                    order_price = last_price + (last_price * price_adjustment)
-                    position_size = allocated_usd / order_price
-                    order = exchange.create_limit_order(symbol, order_action, position_size, order_price)
-
-                    orders.append(order)
+            if (trade_precedence_symbol in current_symbol_set) & (incoming_trades_pct <= available_usd_pct):
+                orders += _execute_buys(exchange, buy_signals, snapshot.total_value_usd, buy_mult)
 
             # Sell from symbol with trade precedence to make room for incoming trades
-            elif (trade_precedence_symbol in current_trade_symbols) & (incoming_trades_pct > available_usd_pct):
+            elif (trade_precedence_symbol in current_symbol_set) & (incoming_trades_pct > available_usd_pct):
                 trade_precedence_currency = utils.get_currency_from_symbol(trade_precedence_symbol)
                 trade_precedence_owned = exchange.get_total_currency(trade_precedence_currency)
 
                 # Calculate proportion of current trade to sell to get account to target allocation
                 account_sell_pct = (incoming_trades_pct - available_usd_pct) + unallocated_pct
-                current_pct = Decimal(str(account_allocation_dict.get(trade_precedence_currency))) / total_account_value_usd
+                current_pct = snapshot.pct(trade_precedence_currency)
                 position_sell_pct = round(account_sell_pct / current_pct, 2)
 
                 last_price = exchange.get_last_price(trade_precedence_symbol)
-                price_adjustment = Decimal(str(increment_pct)).quantize(Decimal('0.0001'), rounding=ROUND_HALF_UP)
 
                 sell_amount = round(trade_precedence_owned * position_sell_pct, 4)
-                order_price = last_price - (last_price * price_adjustment)
+                order_price = last_price * sell_mult
                 order = exchange.create_limit_order(trade_precedence_symbol, "sell", sell_amount, order_price)
 
                 orders.append(order)
@@ -222,63 +268,33 @@ def buy_side_boost(exchange: Exchange, trades: List[dict], increment_pct: float=
                 if not wait_till_sell_order_fill(exchange, trade_precedence_currency, trade_precedence_owned - sell_amount, wait_seconds=15, max_attempts=4):
                     raise ValueError(f"Failed to fill sell order on {trade_precedence_symbol} in specified time.")
 
-                account_allocation_dict = exchange.get_account_allocation()
-                total_account_value_usd = Decimal(str(sum(account_allocation_dict.values()) ))
-
-                for trade in buy_signals:
-                    symbol = trade.get("symbol")
-                    currency = trade.get("currency")
-                    order_action = trade.get("order_action")
-                    percentage = trade.get("percentage")
+                snapshot.refresh()
 
-                    last_price = exchange.get_last_price(symbol)
-                    price_adjustment = Decimal(str(increment_pct)).quantize(Decimal('0.0001'), rounding=ROUND_HALF_UP)
-
-                    allocated_usd = total_account_value_usd * percentage
-                    order_price = last_price + (last_price * price_adjustment)
-                    position_size = allocated_usd / order_price
-                    order = exchange.create_limit_order(symbol, order_action, position_size, order_price)
-
-                    orders.append(order)
+                orders += _execute_buys(exchange, buy_signals, snapshot.total_value_usd, buy_mult)
 
             # No selling required
-            elif (trade_precedence_symbol in incoming_trade_symbols) & (incoming_trades_pct + available_pct + unallocated_pct <= available_usd_pct):
-                for trade in buy_signals:
-                    symbol = trade.get("symbol")
-                    currency = trade.get("currency")
-                    order_action = trade.get("order_action")
-                    if symbol == trade_precedence_symbol:
-                        percentage = trade.get("percentage") + available_pct
-                    else:
-                        percentage = trade.get("percentage")
-
-                    last_price = exchange.get_last_price(symbol)
-                    price_adjustment = Decimal(str(increment_pct)).quantize(Decimal('0.0001'), rounding=ROUND_HALF_UP)
-
-                    allocated_usd = total_account_value_usd * percentage
-                    order_price = last_price + (last_price * price_adjustment)
-                    position_size = allocated_usd / order_price
-                    order = exchange.create_limit_order(symbol, order_action, position_size, order_price)
-
-                    orders.append(order)
+            elif (trade_precedence_symbol in incoming_symbol_set) & (incoming_trades_pct + available_pct + unallocated_pct <= available_usd_pct):
+                orders += _execute_buys(
+                    exchange, buy_signals, snapshot.total_value_usd, buy_mult,
+                    precedence_symbol=trade_precedence_symbol, available_pct=available_pct
+                )
 
             # Sell from current trades symbol with trade precedence to make room for incoming trades
-            elif (trade_precedence_symbol in incoming_trade_symbols) & (incoming_trades_pct + available_pct + unallocated_pct > available_usd_pct):
+            elif (trade_precedence_symbol in incoming_symbol_set) & (incoming_trades_pct + available_pct + unallocated_pct > available_usd_pct):
                 sell_from_symbol = utils.get_trade_precedence(current_trade_symbols)
                 sell_from_currency = utils.get_currency_from_symbol(sell_from_symbol)
                 sell_from_owned = exchange.get_total_currency(sell_from_currency)
 
-                target_pct = Decimal(str(utils.get_percentage_from_symbol(sell_from_symbol)))
-                current_pct = Decimal(str(account_allocation_dict.get(sell_from_currency))) / total_account_value_usd
+                target_pct = current_config_pct_by_symbol[sell_from_symbol]
+                current_pct = snapshot.pct(sell_from_currency)
                 
                 account_sell_pct = current_pct - target_pct
                 position_sell_pct = round(account_sell_pct / current_pct, 2)
 
                 last_price = exchange.get_last_price(sell_from_symbol)
-                price_adjustment = Decimal(str(increment_pct)).quantize(Decimal('0.0001'), rounding=ROUND_HALF_UP)
 
                 sell_amount = round(sell_from_owned * position_sell_pct, 4)
-                order_price = last_price - (last_price * price_adjustment)
+                order_price = last_price * sell_mult
                 order = exchange.create_limit_order(sell_from_symbol, "sell", sell_amount, order_price)
 
                 orders.append(order)
@@ -287,49 +303,61 @@ def buy_side_boost(exchange: Exchange, trades: List[dict], increment_pct: float=
                 if not wait_till_sell_order_fill(exchange, sell_from_currency, sell_from_owned - sell_amount, wait_seconds=15, max_attempts=4):
                     raise ValueError(f"Failed to fill sell order on {sell_from_symbol} in specified time.")
 
-                account_allocation_dict = exchange.get_account_allocation()
-                total_account_value_usd = Decimal(str(sum(account_allocation_dict.values())))
+                snapshot.refresh()
 
-                for trade in buy_signals:
-                    symbol = trade.get("symbol")
-                    currency = trade.get("currency")
-                    order_action = trade.get("order_action")
+                orders += _execute_buys(
+                    exchange, buy_signals, snapshot.total_value_usd, buy_mult,
+                    precedence_symbol=trade_precedence_symbol, available_pct=available_pct
+                )
 
-                    if symbol == trade_precedence_symbol:
-                        percentage = trade.get("percentage") + available_pct
-                    else:
-                        percentage = trade.get("percentage")
+        # If no active trades, use full account value for incoming trades, prioritizing the symbol with trade precedence.
+        elif not current_trade_symbols:
+            orders += _execute_buys(
+                exchange, buy_signals, snapshot.quote_usd, buy_mult,
+                precedence_symbol=trade_precedence_symbol, available_pct=Decimal(str(available_pct))
+            )
+
+    return orders
+
+def _execute_buys(
+    exchange: Exchange, 
+    buy_signals: List[trade_processing.TradeSignal], 
+    total_value_usd: Decimal, 
+    buy_mult: Decimal=Decimal(1), 
+    precedence_symbol: str=None, 
+    available_pct: Decimal=0,
+) -> List:
+    """
+    Places limit buy orders sized as a percentage of the given account value.
 
-                    last_price = exchange.get_last_price(symbol)
-                    price_adjustment = Decimal(str(increment_pct)).quantize(Decimal('0.0001'), rounding=ROUND_HALF_UP)
+    Args:
+        exchange (Exchange): An instance of the exchange.
+        buy_signals (List[TradeSignal]): A list of buy trades.
+        total_value_usd: Account value in USD the trade percentages are applied to.
+        buy_mult (optional): Multiplier applied to the last price.  Defaults to 1.
+        precedence_symbol (optional): Symbol with trade precedence.
+        available_pct (optional): Otherwise available percentage added to the 
+        symbol with trade precedence.
 
-                    allocated_usd = total_account_value_usd * percentage
-                    order_price = last_price + (last_price * price_adjustment)
-                    position_size = allocated_usd / order_price
-                    order = exchange.create_limit_order(symbol, order_action, position_size, order_price)
+    Returns:
+        List of orders placed on the exchange.
+    """
+    orders = []
+    for trade in buy_signals:
+        symbol = trade.symbol
+        order_action = trade.order_action
+        percentage = trade.percentage
+        if symbol == precedence_symbol:
+            percentage += available_pct
 
-                    orders.append(order)
+        last_price = exchange.get_last_price(symbol)
 
-        # If no active trades, use full account value for incoming trades, prioritizing the symbol with trade precedence.
-        elif not current_trade_symbols:
-            for trade in buy_signals:
-                symbol = trade.get("symbol")
-                currency = trade.get("currency")
-                order_action = trade.get("order_action")
-                if symbol == trade_precedence_symbol:
-                    percentage = trade.get("percentage") + Decimal(str(available_pct))
-                else:
-                    percentage = trade.get("percentage")
-
-                last_price = exchange.get_last_price(symbol)
-                price_adjustment = Decimal(str(increment_pct)).quantize(Decimal('0.0001'), rounding=ROUND_HALF_UP)
-
-                allocated_usd = total_usd * percentage
-                order_price = last_price + (last_price * price_adjustment)
-                position_size = allocated_usd / order_price
-                order = exchange.create_limit_order(symbol, order_action, position_size, order_price)
+        allocated_usd = total_value_usd * percentage
+        order_price = last_price * buy_mult
+        position_size = allocated_usd / order_price
+        order = exchange.create_limit_order(symbol, order_action, position_size, order_price)
 
-                orders.append(order)
+        orders.append(order)
 
     return orders
 
@@ -1,7 +1,54 @@
-from typing import List
+import logging
+from typing import Iterator, List, Tuple, Union
+from decimal import Decimal
 from datetime import datetime
+from dataclasses import dataclass
 from chalicelib import utils
 
+logger = logging.getLogger("app")
+
+# Attributes of the TradingView alert message, only order_price is numeric
+SIGNAL_DECIMAL_FIELDS = ("order_price",)
+SIGNAL_STRING_FIELDS = frozenset({"ticker", "create_ts", "order_action", "order_comment"})
+
+@dataclass(slots=True, frozen=True)
+class TradeSignal:
+    """
+    Trade signal attributes used when executing trades.
+
+    Attributes:
+        symbol (str): Symbol of the asset.
+        currency (str): Currency of the asset.
+        order_action (str): Action to perform ("buy" or "sell").
+        percentage (Decimal): Percentage of total allocation for "buy" orders.
+    """
+    symbol: str
+    currency: str
+    order_action: str
+    percentage: Decimal = Decimal(0)
+
+    @classmethod
+    def from_dict(cls, trade: dict) -> "TradeSignal":
+        """
+        Creates a TradeSignal from a trade signal stored in the database.
+
+        Raises:
+            ValueError: When a buy trade signal is missing 'percentage' attribute.
+        """
+        order_action = trade.get("order_action")
+        percentage = trade.get("percentage")
+        if percentage is None:
+            if order_action == "buy":
+                raise ValueError("Buy trade signal missing 'percentage' attribute.")
+            percentage = Decimal(0)
+
+        return cls(
+            symbol=trade.get("symbol"),
+            currency=trade.get("currency"),
+            order_action=order_action,
+            percentage=percentage,
+        )
+
 def preprocess_trade_signal(trade_signal: dict) -> dict:
     """
     Processes incoming trade signals before writing to database.
@@ -32,43 +79,60 @@ def preprocess_trade_signal(trade_signal: dict) -> dict:
             raise ValueError("Trade signal missing 'time' attribute")
         trade_signal["create_ts"] = trade_signal.pop("time")
 
+        # Convert numeric attributes of the signal to Decimal for DynamoDB
+        for field, value in trade_signal.items():
+            if field in SIGNAL_DECIMAL_FIELDS:
+                trade_signal[field] = utils.convert_to_decimal(value)
+            elif field not in SIGNAL_STRING_FIELDS:
+                # Fields added to the alert message by the user can hold any JSON value
+                trade_signal[field] = utils.convert_floats_to_decimals(value)
+
         # Add features from configuration file
         for attribute, value in ticker_config.items():
-            trade_signal[attribute] = value
-        
-        trade_signal = utils.convert_floats_to_decimals(trade_signal)
+            trade_signal[attribute] = utils.convert_to_decimal(value)
 
         return trade_signal
 
     except ValueError as e:
         raise e
     
-def get_active_strategy_tickers(threshold: float=0) -> List:
+def _active_items(threshold: float=0) -> Iterator[Tuple[str, dict]]:
     """
-    Get tickers of active strategies based on a percentage threshold.
+    Iterates once over the strategy configs and yields active strategies.
 
     Args:
         threshold: The minimum percentage threshold for a strategy to be 
         considered active.
 
-    Returns:
-        list: List of tickers for active strategies.
+    Yields:
+        Tuple of ticker and config for each active strategy.
     """
     try:
         configs = utils.get_strategy_config()
     except Exception as e:
-        print(f"Error retrieving strategy configs: {e}")
-        return []
+        logger.error("Error retrieving strategy configs: %s", e)
+        return
 
     if not isinstance(configs, dict):
-        print("Strategy configurations should be provided as a dictionary.")
-        return []
+        logger.error("Strategy configurations should be provided as a dictionary.")
+        return
+
+    for ticker, config in configs.items():
+        if config.get("percentage", 0) > threshold:
+            yield ticker, config
+
+def get_active_strategy_tickers(threshold: float=0) -> List:
+    """
+    Get tickers of active strategies based on a percentage threshold.
+
+    Args:
+        threshold: The minimum percentage threshold for a strategy to be 
+        considered active.
 
-    active_tickers = [
-        ticker for ticker, config in configs.items() 
-        if config.get("percentage", 0) > threshold
-    ]
-    return active_tickers
+    Returns:
+        list: List of tickers for active strategies.
+    """
+    return [ticker for ticker, _ in _active_items(threshold)]
 
 def get_active_strategy_configs(threshold: float=0) -> List:
     """
@@ -81,35 +145,25 @@ def get_active_strategy_configs(threshold: float=0) -> List:
     Returns:
         list: List of currencies for active strategies.
     """
-    try:
-        configs = utils.get_strategy_config()
-    except Exception as e:
-        print(f"Error retrieving strategy configs: {e}")
-        return []
+    return [config for _, config in _active_items(threshold)]
 
-    if not isinstance(configs, dict):
-        print("Strategy configurations should be provided as a dictionary.")
-        return []
-
-    config_dicts = [
-        config_dict for config_dict in configs.values() 
-        if config_dict.get("percentage", 0) > threshold
-    ]
-    return config_dicts
-
-def get_ticker_recent_signals(ticker: str, cutoff_time: datetime, table_name: str) -> List:
+def get_ticker_recent_signals(ticker: str, cutoff_time: Union[datetime, str], table_name: str) -> List:
     """
     Retrieves trade signals for a given ticker that are newer than cutoff_time.
 
     Args:
         ticker: Symbol representing a market on TradingView.
-        cutoff_time: Filters trade signals by their create_ts >= cutoff_time.
+        cutoff_time: Filters trade signals by their create_ts >= cutoff_time. 
+        Either a datetime or its ISO 8601 string.
         table_name: Name of DynamoDB table that stores trade signals
 
     Returns:
         List of JSON objects containing trades that meet the criteria.  If no 
         trades meet criteria returns an empty list.
     """
+    if isinstance(cutoff_time, datetime):
+        cutoff_time = cutoff_time.isoformat()  # Convert datetime to ISO 8601 format
+
     try:
         dynamodb_manager = utils.DynamoDBManager()
         table = dynamodb_manager.get_table(table_name)
@@ -121,7 +175,7 @@ def get_ticker_recent_signals(ticker: str, cutoff_time: datetime, table_name: st
             },
             ExpressionAttributeValues={
                 ":ticker": ticker,
-                ":cutoff_time": cutoff_time.isoformat()  # Convert datetime to ISO 8601 format
+                ":cutoff_time": cutoff_time
             },
             ScanIndexForward=False  # To get results in descending order of create_ts
         )
@@ -145,10 +199,11 @@ def get_all_recent_signals(cutoff_time: datetime, table_name: str) -> List:
     """
     try:
         active_tickers = get_active_strategy_tickers()
+        cutoff_iso = cutoff_time.isoformat()
         trade_signals = []
         for ticker in active_tickers:
-            trade_signals += get_ticker_recent_signals(ticker, cutoff_time, table_name)
+            trade_signals += get_ticker_recent_signals(ticker, cutoff_iso, table_name)
         return trade_signals
     except Exception as e:
-        print(f"Error in retrieving recent signals: {e}")
+        logger.error("Error in retrieving recent signals: %s", e)
         return []
\ No newline at end of file
@@ -1,10 +1,33 @@
+import re
 import json
+import time
 import boto3
 import os
-from typing import List
+import logging
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from decimal import Decimal
 from datetime import datetime, timezone
+from pathlib import Path
+
+logger = logging.getLogger("app")
+
+# Shared by all AWS clients so credentials and signing keys are resolved once per container
+BOTO3_SESSION = boto3.session.Session()
+
+# Resolved next to this module so loading does not depend on the working directory
+STRATEGY_CONFIG_PATH = Path(__file__).parent / "strategy_config.json"
+_STRATEGY_CONFIG_STR = os.fspath(STRATEGY_CONFIG_PATH)
+
+# The Lambda deployment package is read-only, so the config cannot change within a container
+_STRATEGY_CONFIG_READ_ONLY = "AWS_LAMBDA_FUNCTION_NAME" in os.environ
+
+_BOOL_MAP = {"true": True, "false": False}
+
+# Matches numbers formatted as strings, e.g. "100", "100.0", "100." or ".5"
+_NUM_RE = re.compile(r"(?:\d+\.?\d*|\.\d+)\Z", re.ASCII).match
 
 
 class APIKeyManager:
@@ -19,6 +42,8 @@ class APIKeyManager:
         api_key (str): The retrieved API key.
         api_secret (str): The retrieved API secret.
     """
+    _client = None
+
     def __init__(self, secret_name: str):
         """
         Initializes the APIKeyManager object with the provided secret name.
@@ -37,8 +62,11 @@ class APIKeyManager:
 
         If the API keys have already been retrieved, this method does nothing.
         """
+        if APIKeyManager._client is None:
+            APIKeyManager._client = BOTO3_SESSION.client("secretsmanager")
+
         try:
-            secret_string = boto3.client("secretsmanager").get_secret_value(
+            secret_string = APIKeyManager._client.get_secret_value(
                 SecretId=self.secret_name
             )
             secrets = secret_string.get("SecretString")
@@ -75,25 +103,28 @@ class APIKeyManager:
             self._retrieve_api_keys()
         return self.api_secret
 
+DYNAMODB_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+)
 
 class DynamoDBManager:
     """
     Class for managing connections to DynamoDB and related operations.
-    """
 
-    def __init__(self):
-        """
-        Initializes the DynamoDBManager.
-        """
-        self._client = None
+    The DynamoDB resource and table objects are shared by every instance, so 
+    they are only created once per Lambda container.
+    """
+    _client = None
+    _tables: Dict[str, Any] = {}
 
     def _get_client(self):
         """
         Establishes connection to DynamoDB if no connection has been made.
         """
-        if self._client is None:
-            self._client = boto3.resource("dynamodb")
-        return self._client
+        if DynamoDBManager._client is None:
+            DynamoDBManager._client = BOTO3_SESSION.resource("dynamodb", config=DYNAMODB_CONFIG)
+        return DynamoDBManager._client
 
     def get_table(self, table_name: str):
         """
@@ -105,9 +136,13 @@ class DynamoDBManager:
         Returns:
             DynamoDB table resource object.
         """
+        if table_name in self._tables:
+            return self._tables[table_name]
+
         try:
             client = self._get_client()
             table = client.Table(table_name)
+            self._tables[table_name] = table
             return table
         except ClientError as e:
             if e.response['Error']['Code'] == 'ResourceNotFoundException':
@@ -121,36 +156,86 @@ class DynamoDBManager:
             
 def get_env_var(name: str, default_value: bool | None = None) -> bool:
     """Gets environment variable and returns as boolean."""
-    true_ = ("true", "True")
-    false_ = ("false", "False")  
     value: str | None = os.environ.get(name, None)
     if value is None:
         if default_value is None:
             raise ValueError(f'Variable `{name}` not set!')
         else:
             value = str(default_value)
-    if value.lower() not in true_ + false_:
+    result = _BOOL_MAP.get(value.lower())
+    if result is None:
         raise ValueError(f'Invalid value `{value}` for variable `{name}`')
-    return value in true_
+    return result
 
-def load_strategy_config():
-    """Load strategy configuration from file."""
+def _strategy_config_mtime() -> Optional[float]:
+    """
+    Get the last modification time of the strategy configuration file.
+
+    Returns None when running on Lambda, where the file cannot change.
+    """
+    if _STRATEGY_CONFIG_READ_ONLY:
+        return None
+
+    try:
+        return os.stat(_STRATEGY_CONFIG_STR).st_mtime
+    except FileNotFoundError as e:
+        raise FileNotFoundError("Strategy configuration file not found.") from e
+
+@lru_cache(maxsize=1)
+def _load_strategy_config_cached(mtime: Optional[float]) -> Dict[str, Any]:
+    """Parses the strategy configuration file, once per modification time."""
     try:
-        with open("chalicelib/strategy_config.json") as f:
-            return json.load(f)
+        with open(_STRATEGY_CONFIG_STR, "rb") as f:
+            return json.loads(f.read(), parse_float=Decimal, parse_int=Decimal)
     except FileNotFoundError as e:
         raise FileNotFoundError("Strategy configuration file not found.") from e
     except json.JSONDecodeError as e:
         raise ValueError("Error parsing JSON in strategy configuration file.") from e
 
+def load_strategy_config():
+    """
+    Load strategy configuration from file.
+
+    Numbers are parsed directly to Decimal, so the configuration can be 
+    written to DynamoDB and used in allocation math without conversion. 
+    The parsed configuration is cached until the file is modified, so the 
+    returned dict is shared between callers and must not be mutated.
+    """
+    return _load_strategy_config_cached(_strategy_config_mtime())
+
 def get_strategy_config():
     """Get configuration dict for trading strategy."""
     return load_strategy_config()
 
+def _dec(value) -> Decimal:
+    """
+    Converts a number to Decimal through its string representation.
+
+    Decimals are returned unchanged. Floats and strings are parsed through a 
+    cache keyed on their text, so repeated values such as configured 
+    percentages share one instance without equal values like 0.2 and 0.20 
+    sharing a representation.
+    """
+    value_type = type(value)
+    if value_type is Decimal:
+        return value
+    if value_type is float:
+        return _parse_decimal(str(value))
+    if value_type is str:
+        return _parse_decimal(value)
+    return Decimal(str(value))
+
+@lru_cache(maxsize=128)
+def _parse_decimal(text: str) -> Decimal:
+    return Decimal(text)
+
 def convert_floats_to_decimals(data):
     """
-    Recursively converts float values and numbers formatted as strings to 
-    Decimal in a dictionary.
+    Converts float values and numbers formatted as strings to Decimal in a 
+    nested dictionary.
+
+    Nested dicts and lists are walked with an explicit stack rather than 
+    recursion, so deeply nested data cannot hit the recursion limit.
 
     Args:
         data: Dictionary containing float values and numbers formatted as 
@@ -160,41 +245,123 @@ def convert_floats_to_decimals(data):
         Dictionary with float values and numbers formatted as strings converted 
         to Decimal.
     """
-    if isinstance(data, dict):
-        return {key: convert_floats_to_decimals(value) for key, value in data.items()}
-    elif isinstance(data, list):
-        return [convert_floats_to_decimals(item) for item in data]
-    elif isinstance(data, float) or (isinstance(data, str) and data.replace(".", "", 1).isdigit()):
-        return Decimal(str(data))
-    else:
-        return data
+    root = [None]
+    stack = [(root, 0, data)]
+    while stack:
+        parent, key, value = stack.pop()
+        value_type = type(value)
+        if value_type is dict:
+            container = dict.fromkeys(value)  # Preserve key order
+            parent[key] = container
+            stack.extend((container, k, v) for k, v in value.items())
+        elif value_type is list:
+            container = [None] * len(value)
+            parent[key] = container
+            stack.extend((container, i, v) for i, v in enumerate(value))
+        elif value_type is float:
+            parent[key] = _dec(value)
+        elif value_type is str:
+            parent[key] = Decimal(value) if _NUM_RE(value) else value
+        elif isinstance(value, (dict, list)):
+            # Walk subclasses as their base type
+            stack.append((parent, key, dict(value) if isinstance(value, dict) else list(value)))
+        else:
+            parent[key] = convert_to_decimal(value)
+    return root[0]
+
+def convert_to_decimal(value):
+    """
+    Converts a float or a number formatted as a string to Decimal.
+
+    Args:
+        value: Value to convert.
+
+    Returns:
+        Decimal if value is a float or a number formatted as a string, 
+        otherwise value unchanged.
+    """
+    if isinstance(value, float):
+        return _dec(value)
+    elif isinstance(value, str) and _NUM_RE(value):
+        return Decimal(value)
+    return value
 
 def get_utc_now_rounded():
     """Gets current time in utc rounded down to the hour."""
-    utcnow = datetime.now(timezone.utc)
-    return utcnow.replace(minute=0, second=0, microsecond=0)
+    hour_ts = int(time.time()) // 3600 * 3600
+    return datetime.fromtimestamp(hour_ts, timezone.utc)
+
+def _strategy_indexes() -> Tuple[Dict[str, dict], Dict[str, dict]]:
+    """
+    Get strategy configs indexed by currency and by symbol.
+
+    Returns:
+        Tuple containing a dict mapping currency to config and a dict mapping 
+        symbol to config.
+    """
+    return _build_strategy_indexes(_strategy_config_mtime())
+
+@lru_cache(maxsize=1)
+def _build_strategy_indexes(mtime: Optional[float]) -> Tuple[Dict[str, dict], Dict[str, dict]]:
+    """Builds the indexes of _strategy_indexes for a configuration file version."""
+    config_by_currency = dict()
+    config_by_symbol = dict()
+    for value in get_strategy_config().values():
+        config_by_currency.setdefault(value.get("currency"), value)
+        config_by_symbol.setdefault(value.get("symbol"), value)
+    return config_by_currency, config_by_symbol
 
 def get_symbol_from_currency(currency):
     """Get the symbol from currency defined in strategy_config.json"""
-    strategy_config_dict = get_strategy_config()
-    for key, value in strategy_config_dict.items():
-        if value.get("currency") == currency:
-            return value.get("symbol")
+    config = _strategy_indexes()[0].get(currency)
+    if config:
+        return config.get("symbol")
         
 def get_currency_from_symbol(symbol):
     """Get the currency from symbol defined in strategy_config.json"""
-    strategy_config_dict = get_strategy_config()
-    for key, value in strategy_config_dict.items():
-        if value.get("symbol") == symbol:
-            return value.get("currency")
+    config = _strategy_indexes()[1].get(symbol)
+    if config:
+        return config.get("currency")
         
 def get_percentage_from_symbol(symbol):
     """Get the percentage from symbol defined in strategy_config.json"""
-    strategy_config_dict = get_strategy_config()
-    for key, value in strategy_config_dict.items():
-        if value.get("symbol") == symbol:
-            return value.get("percentage", 0)
+    config = _strategy_indexes()[1].get(symbol)
+    if config:
+        return config.get("percentage", 0)
         
+def build_symbol_indexes() -> Tuple[Dict[str, str], Dict[str, Decimal]]:
+    """
+    Builds lookup tables from strategy_config.json in a single pass.
+
+    The tables are rebuilt only when the configuration file is modified.
+
+    Returns:
+        Tuple containing a dict mapping currency to symbol and a dict mapping 
+        symbol to percentage.
+    """
+    return _build_symbol_indexes(_strategy_config_mtime())
+
+@lru_cache(maxsize=1)
+def _build_symbol_indexes(mtime: Optional[float]) -> Tuple[Dict[str, str], Dict[str, Decimal]]:
+    """Builds the lookup tables of build_symbol_indexes for a configuration file version."""
+    config_by_currency, config_by_symbol = _strategy_indexes()
+    symbol_by_currency = {currency: config.get("symbol") for currency, config in config_by_currency.items()}
+    pct_by_symbol = {symbol: _dec(config.get("percentage", 0)) for symbol, config in config_by_symbol.items()}
+    return symbol_by_currency, pct_by_symbol
+
+def get_total_allocation_pct() -> Decimal:
+    """
+    Get the total percentage allocated to strategies in strategy_config.json.
+
+    The total is recomputed only when the configuration file is modified.
+    """
+    return _total_allocation_pct(_strategy_config_mtime())
+
+@lru_cache(maxsize=1)
+def _total_allocation_pct(mtime: Optional[float]) -> Decimal:
+    """Sums the configured strategy percentages for a configuration file version."""
+    return sum(_dec(strategy.get("percentage", 0)) for strategy in get_strategy_config().values())
+
 def get_trade_precedence(trade_symbols: List) -> str:
     """
     Determines which trade out of the trade symbols has the highest allocation percentage.
@@ -203,11 +370,41 @@ def get_trade_precedence(trade_symbols: List) -> str:
 
     Args:
         trade_symbols (List): List of incoming and current trade symbols.
-        strategy_config (dict): Configuration settings for each trading strategy.
 
     Returns:
-        Symbol with the highest allocation percentage.
+        Symbol with the highest allocation percentage. Ties go to the symbol 
+        listed first.
+    """
+    if not trade_symbols:
+        return None
+    if len(trade_symbols) == 1:
+        return trade_symbols[0]
+
+    pct_by_symbol = build_symbol_indexes()[1]
+
+    # max keeps the first of equal percentages, so ties go by input order
+    return max(trade_symbols, key=lambda symbol: pct_by_symbol.get(symbol, 0))
+
+def reload_strategy_config():
+    """
+    Clears the cached strategy configuration and the lookup tables derived 
+    from it, then builds them again.
+
+    Used by tests that swap the configuration and to warm the caches on import.
     """
-    trade_precedence = max(trade_symbols, key=get_percentage_from_symbol, default=None)
+    _load_strategy_config_cached.cache_clear()
+    _build_strategy_indexes.cache_clear()
+    _build_symbol_indexes.cache_clear()
+    _total_allocation_pct.cache_clear()
+
+    build_symbol_indexes()
+    get_total_allocation_pct()
 
-    return trade_precedence
\ No newline at end of file
+# Build the lookup tables during the Lambda init phase rather than the first invocation
+try:
+    reload_strategy_config()
+except (FileNotFoundError, ValueError) as e:
+    logger.error("Error loading strategy configuration: %s", e)
+    # The deployed config cannot change within a container, so fail the init phase
+    if _STRATEGY_CONFIG_READ_ONLY:
+        raise
@@ -0,0 +1,63 @@
+import pytest
+from types import MappingProxyType
+
+def create_limit_order_side_effect_func(symbol, side, amount, order_price):
+    price = float(order_price)
+    amount = float(amount)
+    return {'symbol': symbol, 'side': side, 'price': price, 'cost': round(price * amount, 2), 'amount': round(amount, 4)}
+
+class FakeExchange:
+    """
+    Lightweight stand-in for Exchange that serves canned data and records orders.
+
+    Args:
+        allocations: Account allocations returned by successive get_account_allocation calls.
+        prices: Last price of each symbol.
+        currency_totals: Amounts returned by successive get_total_currency calls.
+
+    Attributes:
+        calls (list): Arguments of each create_limit_order call, in order.
+    """
+    __slots__ = ("_allocations", "_prices", "_currency_totals", "calls")
+
+    def __init__(self, allocations=(), prices=None, currency_totals=()):
+        self._allocations = iter(allocations)
+        self._prices = prices or {}
+        self._currency_totals = iter(currency_totals)
+        self.calls = []
+
+    def get_account_allocation(self):
+        return next(self._allocations)
+
+    def get_last_price(self, symbol):
+        return self._prices[symbol]
+
+    def get_total_currency(self, currency):
+        return next(self._currency_totals)
+
+    def create_limit_order(self, symbol, side, amount, order_price):
+        self.calls.append((symbol, side, amount, order_price))
+        return create_limit_order_side_effect_func(symbol, side, amount, order_price)
+
+@pytest.fixture
+def make_exchange():
+    """
+    Fixture returning a factory for FakeExchange instances.
+    """
+    return FakeExchange
+
+@pytest.fixture(scope="session")
+def mock_config():
+    """
+    Fixture for a read-only strategy config shared across the test session.
+    """
+    return MappingProxyType({
+        "SOLUSD": MappingProxyType({"symbol": "SOL", "percentage": 0.60, "stop_loss": 0.066}),
+    })
+
+@pytest.fixture(scope="session")
+def mock_active_tickers():
+    """
+    Fixture for the active strategy tickers shared across the test session.
+    """
+    return ("BTCUSD", "SOLUSDT")
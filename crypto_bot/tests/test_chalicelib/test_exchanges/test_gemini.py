@@ -3,15 +3,19 @@ from unittest.mock import MagicMock, patch
 from decimal import Decimal
 from chalicelib.exchanges.gemini import GeminiClient
 
-def test_get_most_recent_trade():
-    exchange = GeminiClient()
-    exchange.client = MagicMock()
-    exchange.client.fetch_my_trades.side_effect = [
+MOST_RECENT_TRADE_CASES = [
+    pytest.param(
         [
             {'symbol': 'ETH/USD', 'side': 'buy', 'price': 3359.31, 'cost': 500, 'amount': 0.156192},
             {'symbol': 'ETH/USD', 'side': 'sell', 'price': 3679.36, 'cost': 500, 'amount': 0.156192},
             {'symbol': 'ETH/USD', 'side': 'buy', 'price': 3359.31, 'cost': 2000, 'amount': 1.15}
         ],
+        [
+            {'symbol': 'ETH/USD', 'side': 'buy', 'price': 3359.31, 'cost': 2000, 'amount': 1.15}
+        ],
+        id="open_trade",
+    ),
+    pytest.param(
         [
             {'symbol': 'ETH/USD', 'side': 'buy', 'price': 3359.31, 'cost': 500, 'amount': 0.156192},
             {'symbol': 'ETH/USD', 'side': 'sell', 'price': 3679.36, 'cost': 500, 'amount': 0.156192},
@@ -19,63 +23,89 @@ def test_get_most_recent_trade():
             {'symbol': 'ETH/USD', 'side': 'buy', 'price': 3359.31, 'cost': 200, 'amount': 0.15}
         ],
         [
-            {'symbol': 'ETH/USD', 'side': 'buy', 'price': 3359.31, 'cost': 500, 'amount': 0.156192},
-            {'symbol': 'ETH/USD', 'side': 'sell', 'price': 3679.36, 'cost': 500, 'amount': 0.156192},
             {'symbol': 'ETH/USD', 'side': 'buy', 'price': 3359.31, 'cost': 2000, 'amount': 1.15},
-            {'symbol': 'ETH/USD', 'side': 'buy', 'price': 3359.31, 'cost': 200, 'amount': 0.115},
-            {'symbol': 'ETH/USD', 'side': 'sell', 'price': 3679.36, 'cost': 1000, 'amount': 0.55},
+            {'symbol': 'ETH/USD', 'side': 'buy', 'price': 3359.31, 'cost': 200, 'amount': 0.15}
         ],
-        [   
+        id="open_trade_multiple_buys",
+    ),
+    pytest.param(
+        [
             {'symbol': 'ETH/USD', 'side': 'buy', 'price': 3359.31, 'cost': 500, 'amount': 0.156192},
             {'symbol': 'ETH/USD', 'side': 'sell', 'price': 3679.36, 'cost': 500, 'amount': 0.156192},
-        ],
-        []
-    ]   
-    expected_results = [
-        [
-            {'symbol': 'ETH/USD', 'side': 'buy', 'price': 3359.31, 'cost': 2000, 'amount': 1.15}
-        ],
-        [
             {'symbol': 'ETH/USD', 'side': 'buy', 'price': 3359.31, 'cost': 2000, 'amount': 1.15},
-            {'symbol': 'ETH/USD', 'side': 'buy', 'price': 3359.31, 'cost': 200, 'amount': 0.15}
+            {'symbol': 'ETH/USD', 'side': 'buy', 'price': 3359.31, 'cost': 200, 'amount': 0.115},
+            {'symbol': 'ETH/USD', 'side': 'sell', 'price': 3679.36, 'cost': 1000, 'amount': 0.55},
         ],
         [
             {'symbol': 'ETH/USD', 'side': 'buy', 'price': 3359.31, 'cost': 2000, 'amount': 1.15},
             {'symbol': 'ETH/USD', 'side': 'buy', 'price': 3359.31, 'cost': 200, 'amount': 0.115},
             {'symbol': 'ETH/USD', 'side': 'sell', 'price': 3679.36, 'cost': 1000, 'amount': 0.55},
         ],
-        [   
+        id="open_trade_partial_sell",
+    ),
+    pytest.param(
+        [
             {'symbol': 'ETH/USD', 'side': 'buy', 'price': 3359.31, 'cost': 500, 'amount': 0.156192},
             {'symbol': 'ETH/USD', 'side': 'sell', 'price': 3679.36, 'cost': 500, 'amount': 0.156192},
         ],
-        []
-    ]
-    for expected_result in expected_results:
-        result = exchange.get_most_recent_trade('ETH/USD')
-        assert result == expected_result
-
-def test_get_trade_value_usd():
-    exchange = GeminiClient()
+        [
+            {'symbol': 'ETH/USD', 'side': 'buy', 'price': 3359.31, 'cost': 500, 'amount': 0.156192},
+            {'symbol': 'ETH/USD', 'side': 'sell', 'price': 3679.36, 'cost': 500, 'amount': 0.156192},
+        ],
+        id="closed_trade",
+    ),
+    pytest.param([], [], id="no_trades"),
+]
 
-    trades = [
+TRADE_VALUE_USD_CASES = [
+    pytest.param(
         [
             {'symbol': 'ETH/USD', 'side': 'buy', 'price': 3359.31, 'cost': 2000, 'amount': 1.15}
         ],
+        2000,
+        id="single_buy",
+    ),
+    pytest.param(
         [
             {'symbol': 'ETH/USD', 'side': 'buy', 'price': 3359.31, 'cost': 2000, 'amount': 1.15},
             {'symbol': 'ETH/USD', 'side': 'buy', 'price': 3359.31, 'cost': 200, 'amount': 0.115}
         ],
+        2200,
+        id="multiple_buys",
+    ),
+    pytest.param(
         [
             {'symbol': 'ETH/USD', 'side': 'buy', 'price': 3359.31, 'cost': 2000, 'amount': 1.15},
             {'symbol': 'ETH/USD', 'side': 'buy', 'price': 3359.31, 'cost': 200, 'amount': 0.115},
             {'symbol': 'ETH/USD', 'side': 'sell', 'price': 3679.36, 'cost': 1200, 'amount': 0.55},
         ],
-        [   
+        1254,
+        id="partial_sell",
+    ),
+    pytest.param(
+        [
             {'symbol': 'ETH/USD', 'side': 'buy', 'price': 3359.31, 'cost': 500, 'amount': 0.156192},
             {'symbol': 'ETH/USD', 'side': 'sell', 'price': 3679.36, 'cost': 500, 'amount': 0.156192},
         ],
-    ]
-    expected_results = [2000, 2200, 1254, 0]
-    for trade, expected_result in zip(trades, expected_results):
-        result = exchange.get_trade_value_usd(trade)
-        assert result == expected_result
+        0,
+        id="closed_trade",
+    ),
+]
+
+@pytest.fixture(scope="module")
+def exchange():
+    exchange = GeminiClient()
+    exchange.client = MagicMock()
+    return exchange
+
+@pytest.mark.parametrize("trades,expected_result", MOST_RECENT_TRADE_CASES)
+def test_get_most_recent_trade(exchange, trades, expected_result):
+    exchange.client.fetch_my_trades.return_value = trades
+
+    result = exchange.get_most_recent_trade('ETH/USD')
+    assert result == expected_result
+
+@pytest.mark.parametrize("trades,expected_result", TRADE_VALUE_USD_CASES)
+def test_get_trade_value_usd(exchange, trades, expected_result):
+    result = exchange.get_trade_value_usd(trades)
+    assert result == expected_result
@@ -1,5 +1,4 @@
 import pytest
-from unittest.mock import MagicMock, patch
 from decimal import Decimal
 from chalicelib.trade_execution import (
     Exchange, 
@@ -7,6 +6,50 @@ from chalicelib.trade_execution import (
     execute_long_stop, 
     buy_side_boost,
 )
+from chalicelib.utils import reload_strategy_config
+
+# Decimals shared across tests, built once rather than parsed in every call
+D_10 = Decimal("10")
+D_1K = Decimal("1000")
+D_10K = Decimal("10000")
+D_9_999 = Decimal("9.999")
+D_10_001 = Decimal("10.001")
+D_150 = Decimal("150")
+D_155 = Decimal("155")
+D_2500 = Decimal("2500")
+D_50K = Decimal("50000")
+D_51K = Decimal("51000")
+PCT_20 = Decimal("0.2")
+PCT_25 = Decimal("0.25")
+PCT_53 = Decimal("0.53")
+
+MOCK_CONFIG = {
+    "BTCUSD": {"symbol": "BTC/USD", "currency": "BTC", "percentage": PCT_20},
+    "ETHUSD": {"symbol": "ETH/USD", "currency": "ETH", "percentage": PCT_25},
+    "ADAUSD": {"symbol": "ADA/USD", "currency": "ADA", "percentage": Decimal("0")},
+    "SOLUSDT": {"symbol": "SOL/USD", "currency": "SOL", "percentage": PCT_53},
+}
+
+def create_trade(symbol, order_action, percentage=None):
+    trade = {
+        "symbol": symbol,
+        "currency": symbol.partition("/")[0],
+        "order_action": order_action,
+    }
+    if percentage is not None:
+        trade["percentage"] = percentage
+    return trade
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_strategy_config():
+    """
+    Fixture to stub the strategy config once for the whole module.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("chalicelib.utils.get_strategy_config", lambda: MOCK_CONFIG)
+        reload_strategy_config()
+        yield MOCK_CONFIG
+    reload_strategy_config()
 
 class MockExchange(Exchange):
     def __init__(self):
@@ -14,15 +57,15 @@ class MockExchange(Exchange):
     
     def get_total_usd(self):
         # Mock implementation, return some value for testing
-        return Decimal(10000)
+        return D_10K
     
     def get_total_currency(self, currency):
         # Mock implementation, return some value for testing
-        return Decimal(1000)
+        return D_1K
     
     def get_last_price(self, symbol):
         # Mock implementation, return some value for testing
-        return Decimal(10)
+        return D_10
     
     def create_limit_order(self, symbol, order_action, amount, price):
         # Mock implementation, return some value for testing
@@ -32,23 +75,34 @@ class MockExchange(Exchange):
 def mock_exchange():
     return MockExchange()
 
-def test_multi_strategy_allocation_normal(mock_exchange):
-    trades = [
-        {"symbol": "BTC/USD", "currency": "BTC", "order_action": "buy", "percentage": Decimal(str(0.2))},
-        {"symbol": "ETH/USD", "currency": "ETH", "order_action": "sell"}
-    ]
+TEST_CASES = [
+    pytest.param(
+        [
+            create_trade("BTC/USD", "buy", PCT_20),
+            create_trade("ETH/USD", "sell")
+        ],
+        [D_10_001, D_9_999],
+        id="buy_and_sell",
+    ),
+]
+
+@pytest.mark.parametrize("trades,expected_prices", TEST_CASES)
+def test_multi_strategy_allocation(mock_exchange, trades, expected_prices):
     orders = multi_strategy_allocation(mock_exchange, trades, increment_pct=0.0001)
-    assert len(orders) == 2
-    assert orders[0].get("price") == Decimal(str(10.0010))
-    assert orders[1].get("price") == Decimal(str(9.9990))
-
-def test_multi_strategy_allocation_empty_trades(mock_exchange):
-    with pytest.raises(ValueError):
-        multi_strategy_allocation(mock_exchange, [])
-
-def test_multi_strategy_allocation_invalid_order_action(mock_exchange):
-    trades = [{"symbol": "BTC/USD", "currency": "BTC", "order_action": "invalid", "percentage": Decimal(str(0.2))}]
-    with pytest.raises(ValueError):
+    assert [order.get("price") for order in orders] == expected_prices
+
+ERROR_CASES = [
+    pytest.param([], "Trades list is empty.", id="empty_trades"),
+    pytest.param(
+        [create_trade("BTC/USD", "invalid", PCT_20)],
+        "Invalid order action: invalid",
+        id="invalid_order_action",
+    ),
+]
+
+@pytest.mark.parametrize("trades,error_message", ERROR_CASES)
+def test_multi_strategy_allocation_errors(mock_exchange, trades, error_message):
+    with pytest.raises(ValueError, match=error_message):
         multi_strategy_allocation(mock_exchange, trades)
 
 def test_execute_long_stop(mock_exchange):
@@ -56,205 +110,200 @@ def test_execute_long_stop(mock_exchange):
         "symbol": "BTC/USD", 
         "currency": "BTC", 
         "order_action": "sell", 
-        "percentage": Decimal(str(0.2)), 
+        "percentage": PCT_20, 
         "order_comment": "long stop"
     }
     order = execute_long_stop(mock_exchange, trade, increment_pct=0.0001)
-    assert order.get("price") == Decimal(str(9.9990))
-
-def create_limit_order_side_effect_func(symbol, side, amount, order_price):
-    return {'symbol': symbol, 'side': side, 'price': float(order_price), 'cost': float(round(order_price * amount, 2)), 'amount': float(round(amount, 4))}
-
-def test_buy_side_boost_no_active_trades():
-    exchange = MagicMock()
-    exchange.get_account_allocation.return_value = {
-        "USD": 1000,
-        "BTC": 0,
-        "ETH": 0,
-        "SOL": 0,
-    }
-    exchange.get_last_price.return_value = Decimal(str(50000))
-    exchange.create_limit_order.side_effect = create_limit_order_side_effect_func
+    assert order.get("price") == D_9_999
+
+LONG_STOP_ERROR_CASES = [
+    pytest.param("buy", id="buy_order_action"),
+    pytest.param("invalid", id="invalid_order_action"),
+]
+
+@pytest.mark.parametrize("order_action", LONG_STOP_ERROR_CASES)
+def test_execute_long_stop_errors(mock_exchange, order_action):
+    trade = create_trade("BTC/USD", order_action, PCT_20)
+    with pytest.raises(ValueError, match=f"Invalid order action for long stop: {order_action}"):
+        execute_long_stop(mock_exchange, trade)
+
+# Last price of each symbol, shared by the buy_side_boost tests
+PRICES_BTC = {"BTC/USD": D_50K}
+PRICES_BTC_SOL = {"BTC/USD": D_51K, "SOL/USD": D_150}
+PRICES_ETH_SOL = {"ETH/USD": D_2500, "SOL/USD": D_155}
+PRICES_BTC_ETH = {"BTC/USD": D_50K, "ETH/USD": D_2500}
+PRICES_SOL = {"SOL/USD": D_150}
+
+EXPECTED_NO_ACTIVE_TRADES = [
+    {'symbol': 'BTC/USD', 'side': 'buy', 'price': 50000, 'cost': 980, 'amount': 0.0196}
+]
+
+EXPECTED_ACTIVE_NO_PRECEDENCE = [
+    {'symbol': 'BTC/USD', 'side': 'sell', 'price': 51000, 'cost': 800.7, 'amount': 0.0157},
+    {'symbol': 'SOL/USD', 'side': 'buy', 'price': 150, 'cost': 792.25, 'amount': 5.2816}
+]
+
+EXPECTED_ACTIVE_WITH_PRECEDENCE = [
+    {'symbol': 'SOL/USD', 'side': 'sell', 'price': 155, 'cost': 253.78, 'amount': 1.6373},
+    {'symbol': 'ETH/USD', 'side': 'buy', 'price': 2500, 'cost': 255.97, 'amount': 0.1024}
+]
+
+EXPECTED_SELL_SIGNALS = [
+    {'symbol': 'BTC/USD', 'side': 'sell', 'price': 50000, 'cost': 100, 'amount': 0.002},
+    {'symbol': 'ETH/USD', 'side': 'sell', 'price': 2500, 'cost': 25, 'amount': 0.01}
+]
+
+EXPECTED_PARTIAL_ALLOCATION = [
+    {'symbol': 'BTC/USD', 'side': 'buy', 'price': 50000, 'cost': 206, 'amount': 0.0041},
+    {'symbol': 'ETH/USD', 'side': 'buy', 'price': 2500, 'cost': 257.5, 'amount': 0.103}
+]
+
+EXPECTED_PARTIAL_ALLOCATION_INCOMING_PRECEDENCE = [
+    {'symbol': 'SOL/USD', 'side': 'buy', 'price': 150, 'cost': 936, 'amount': 6.24}
+]
+
+def test_buy_side_boost_no_active_trades(make_exchange):
+    exchange = make_exchange(
+        allocations=[
+            {
+                "USD": 1000,
+                "BTC": 0,
+                "ETH": 0,
+                "SOL": 0,
+            }
+        ],
+        prices=PRICES_BTC,
+    )
 
     trades = [
-        {"symbol": "BTC/USD", "currency": "BTC", "order_action": "buy", "percentage": Decimal(str(0.2))},
+        create_trade("BTC/USD", "buy", PCT_20),
     ]
 
-    expected_result = [
-        {'symbol': 'BTC/USD', 'side': 'buy', 'price': 50000, 'cost': 980, 'amount': 0.0196}
-    ]
     result = buy_side_boost(exchange, trades)
 
-    assert result == expected_result
-
-def test_buy_side_boost_active_trade_without_precedence():
-    exchange = MagicMock()
-    exchange.get_account_allocation.side_effect = [
-        {
-            "USD": 20,
-            "BTC": 980,
-            "ETH": 0,
-            "SOL": 0,
-        }, {
-            "USD": 820.7,
-            "BTC": 195,
-            "ETH": 0,
-            "SOL": 0,
-        }
-        ]
-
-    def get_last_price_side_effect(symbol):
-        if symbol == "BTC/USD":
-            return Decimal(str(51000))
-        elif symbol == "SOL/USD":
-            return Decimal(str(150))
-        
-    exchange.get_total_currency.side_effect = [Decimal(str(0.0196)), Decimal(str(0.0039))]
-    exchange.get_last_price.side_effect = get_last_price_side_effect
-    exchange.create_limit_order.side_effect = create_limit_order_side_effect_func
+    assert result == EXPECTED_NO_ACTIVE_TRADES
+    assert exchange.calls == [("BTC/USD", "buy", Decimal("0.0196"), D_50K)]
+
+def test_buy_side_boost_active_trade_without_precedence(make_exchange):
+    exchange = make_exchange(
+        allocations=[
+            {
+                "USD": 20,
+                "BTC": 980,
+                "ETH": 0,
+                "SOL": 0,
+            }, {
+                "USD": 820.7,
+                "BTC": 195,
+                "ETH": 0,
+                "SOL": 0,
+            }
+        ],
+        prices=PRICES_BTC_SOL,
+        currency_totals=[Decimal("0.0196"), Decimal("0.0039")],
+    )
 
     trades = [
-        {"symbol": "SOL/USD", "currency": "SOL", "order_action": "buy", "percentage": Decimal(str(0.53))},
+        create_trade("SOL/USD", "buy", PCT_53),
     ]
 
-    expected_result = [
-        {'symbol': 'BTC/USD', 'side': 'sell', 'price': 51000, 'cost': 800.7, 'amount': 0.0157},
-        {'symbol': 'SOL/USD', 'side': 'buy', 'price': 150, 'cost': 792.25, 'amount': 5.2816}
-    ]
     result = buy_side_boost(exchange, trades)
 
-    assert result == expected_result
-
-def test_buy_side_boost_active_trade_with_precedence():
-    exchange = MagicMock()
-    exchange.get_account_allocation.side_effect = [
-        {
-            "USD": 28.45,
-            "BTC": 195,
-            "ETH": 0,
-            "SOL": 792.25,
-        }, {
-            "USD": 282.4485,
-            "BTC": 195,
-            "ETH": 0,
-            "SOL": 546.441897,
-        }
-        ]
-
-    def get_last_price_side_effect(symbol):
-        if symbol == "ETH/USD":
-            return Decimal(str(2500))
-        elif symbol == "SOL/USD":
-            return Decimal(str(155))
-        
-    exchange.get_total_currency.side_effect = [Decimal(str(5.2816)), Decimal(str(3.6443))]
-    exchange.get_last_price.side_effect = get_last_price_side_effect
-    exchange.create_limit_order.side_effect = create_limit_order_side_effect_func
+    assert result == EXPECTED_ACTIVE_NO_PRECEDENCE
+
+def test_buy_side_boost_active_trade_with_precedence(make_exchange):
+    exchange = make_exchange(
+        allocations=[
+            {
+                "USD": 28.45,
+                "BTC": 195,
+                "ETH": 0,
+                "SOL": 792.25,
+            }, {
+                "USD": 282.4485,
+                "BTC": 195,
+                "ETH": 0,
+                "SOL": 546.441897,
+            }
+        ],
+        prices=PRICES_ETH_SOL,
+        currency_totals=[Decimal("5.2816"), Decimal("3.6443")],
+    )
 
     trades = [
-        {"symbol": "ETH/USD", "currency": "ETH", "order_action": "buy", "percentage": Decimal(str(0.25))},
+        create_trade("ETH/USD", "buy", PCT_25),
     ]
 
-    expected_result = [
-        {'symbol': 'SOL/USD', 'side': 'sell', 'price': 155, 'cost': 253.78, 'amount': 1.6373},
-        {'symbol': 'ETH/USD', 'side': 'buy', 'price': 2500, 'cost': 255.97, 'amount': 0.1024}
-    ]
     result = buy_side_boost(exchange, trades)
 
-    assert result == expected_result
-
-def test_buy_side_boost_sell_signals():
-    exchange = MagicMock()
-    exchange.get_account_allocation.side_effect = [
-        {
-            "USD": 20,
-            "BTC": 200,
-            "ETH": 250,
-            "SOL": 530,
-        }
-        ]
-
-    def get_last_price_side_effect(symbol):
-        if symbol == "BTC/USD":
-            return Decimal(str(50000))
-        elif symbol == "ETH/USD":
-            return Decimal(str(2500))
-        
-    exchange.get_total_currency.side_effect = [Decimal(str(.002)), Decimal(str(.01))]
-    exchange.get_last_price.side_effect = get_last_price_side_effect
-    exchange.create_limit_order.side_effect = create_limit_order_side_effect_func
+    assert result == EXPECTED_ACTIVE_WITH_PRECEDENCE
+
+def test_buy_side_boost_sell_signals(make_exchange):
+    exchange = make_exchange(
+        allocations=[
+            {
+                "USD": 20,
+                "BTC": 200,
+                "ETH": 250,
+                "SOL": 530,
+            }
+        ],
+        prices=PRICES_BTC_ETH,
+        currency_totals=[Decimal("0.002"), Decimal("0.01")],
+    )
 
     trades = [
-        {"symbol": "BTC/USD", "currency": "BTC", "order_action": "sell", "percentage": Decimal(str(0.20))},
-        {"symbol": "ETH/USD", "currency": "ETH", "order_action": "sell", "percentage": Decimal(str(0.25))},
+        create_trade("BTC/USD", "sell", PCT_20),
+        create_trade("ETH/USD", "sell", PCT_25),
     ]
 
-    expected_result = [
-        {'symbol': 'BTC/USD', 'side': 'sell', 'price': 50000, 'cost': 100, 'amount': 0.002},
-        {'symbol': 'ETH/USD', 'side': 'sell', 'price': 2500, 'cost': 25, 'amount': 0.01}
-    ]
     result = buy_side_boost(exchange, trades)
 
-    assert result == expected_result
-
-def test_buy_side_boost_partial_allocation():
-    exchange = MagicMock()
-    exchange.get_account_allocation.side_effect = [
-        {
-            "USD": 500,
-            "BTC": 0,
-            "ETH": 0,
-            "SOL": 530,
-        }
-        ]
-
-    def get_last_price_side_effect(symbol):
-        if symbol == "BTC/USD":
-            return Decimal(str(50000))
-        elif symbol == "ETH/USD":
-            return Decimal(str(2500))
-        
-    exchange.get_last_price.side_effect = get_last_price_side_effect
-    exchange.create_limit_order.side_effect = create_limit_order_side_effect_func
+    assert result == EXPECTED_SELL_SIGNALS
+    assert exchange.calls == [
+        ("BTC/USD", "sell", Decimal("0.002"), D_50K),
+        ("ETH/USD", "sell", Decimal("0.01"), D_2500),
+    ]
+
+def test_buy_side_boost_partial_allocation(make_exchange):
+    exchange = make_exchange(
+        allocations=[
+            {
+                "USD": 500,
+                "BTC": 0,
+                "ETH": 0,
+                "SOL": 530,
+            }
+        ],
+        prices=PRICES_BTC_ETH,
+    )
 
     trades = [
-        {"symbol": "BTC/USD", "currency": "BTC", "order_action": "buy", "percentage": Decimal(str(0.20))},
-        {"symbol": "ETH/USD", "currency": "ETH", "order_action": "buy", "percentage": Decimal(str(0.25))},
+        create_trade("BTC/USD", "buy", PCT_20),
+        create_trade("ETH/USD", "buy", PCT_25),
     ]
 
-    expected_result = [
-        {'symbol': 'BTC/USD', 'side': 'buy', 'price': 50000, 'cost': 206, 'amount': 0.0041},
-        {'symbol': 'ETH/USD', 'side': 'buy', 'price': 2500, 'cost': 257.5, 'amount': 0.103}
-    ]
     result = buy_side_boost(exchange, trades)
 
-    assert result == expected_result
-
-def test_buy_side_boost_partial_allocation_incoming_trade_precedence():
-    exchange = MagicMock()
-    exchange.get_account_allocation.side_effect = [
-        {
-            "USD": 1000,
-            "BTC": 200,
-            "ETH": 0,
-            "SOL": 0,
-        }
-        ]
-
-    def get_last_price_side_effect(symbol):
-        if symbol == "SOL/USD":
-            return Decimal(str(150))
-        
-    exchange.get_last_price.side_effect = get_last_price_side_effect
-    exchange.create_limit_order.side_effect = create_limit_order_side_effect_func
+    assert result == EXPECTED_PARTIAL_ALLOCATION
+
+def test_buy_side_boost_partial_allocation_incoming_trade_precedence(make_exchange):
+    exchange = make_exchange(
+        allocations=[
+            {
+                "USD": 1000,
+                "BTC": 200,
+                "ETH": 0,
+                "SOL": 0,
+            }
+        ],
+        prices=PRICES_SOL,
+    )
 
     trades = [
-        {"symbol": "SOL/USD", "currency": "SOL", "order_action": "buy", "percentage": Decimal(str(0.53))},
+        create_trade("SOL/USD", "buy", PCT_53),
     ]
 
-    expected_result = [
-        {'symbol': 'SOL/USD', 'side': 'buy', 'price': 150, 'cost': 936, 'amount': 6.24}
-    ]
     result = buy_side_boost(exchange, trades)
 
-    assert result == expected_result
\ No newline at end of file
+    assert result == EXPECTED_PARTIAL_ALLOCATION_INCOMING_PRECEDENCE
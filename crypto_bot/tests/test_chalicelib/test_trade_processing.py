@@ -2,7 +2,12 @@ import pytest
 from unittest.mock import MagicMock, patch
 from decimal import Decimal
 from datetime import datetime
-from chalicelib.trade_processing import preprocess_trade_signal, get_ticker_recent_signals
+from chalicelib.trade_processing import (
+    TradeSignal, 
+    preprocess_trade_signal, 
+    get_ticker_recent_signals, 
+    get_all_recent_signals,
+)
 
 @pytest.fixture
 def mock_dynamo_manager():
@@ -28,10 +33,9 @@ def mock_get_strategy_config():
     with patch("chalicelib.utils.get_strategy_config") as mock_get_strategy_config:
         yield mock_get_strategy_config
 
-def test_preprocess_trade_signal(mock_get_strategy_config):
+def test_preprocess_trade_signal(mock_get_strategy_config, mock_config):
     # Mocked configuration
-    ticker_config = {"symbol": "SOL", "percentage": 0.60, "stop_loss": 0.066}
-    mock_get_strategy_config.return_value = {"SOLUSD": ticker_config}
+    mock_get_strategy_config.return_value = mock_config
 
     # Input trade signal
     trade_signal = {
@@ -57,6 +61,28 @@ def test_preprocess_trade_signal(mock_get_strategy_config):
         "stop_loss": Decimal('0.066'),
     }
 
+def test_preprocess_trade_signal_extra_fields(mock_get_strategy_config):
+    """Test case for fields added to the alert message beyond the documented ones."""
+    mock_get_strategy_config.return_value = {"SOLUSD": {"symbol": "SOL", "percentage": 0.60}}
+
+    trade_signal = {
+        "ticker": "SOLUSD",
+        "time": "2024-03-18T08:00:00Z",
+        "order_action": "buy",
+        "order_price": "100.0",
+        "order_comment": "long",
+        "order_contracts": 0.5,
+        "position_size": "1.25",
+        "plot": {"rsi": 70.5},
+    }
+
+    processed_trade_signal = preprocess_trade_signal(trade_signal)
+
+    assert processed_trade_signal["order_contracts"] == Decimal('0.5')
+    assert processed_trade_signal["position_size"] == Decimal('1.25')
+    assert processed_trade_signal["plot"] == {"rsi": Decimal('70.5')}
+    assert processed_trade_signal["order_comment"] == "long"
+
 def test_preprocess_trade_signal_no_ticker():
     """Test case for when trade signalis missing ticker attribute."""
     # Input trade signal
@@ -70,6 +96,23 @@ def test_preprocess_trade_signal_no_ticker():
     with pytest.raises(ValueError, match="Trade signal missing 'ticker' attribute."):
         preprocess_trade_signal(trade_signal)
 
+def test_trade_signal_from_dict():
+    trade = {
+        "ticker": "SOLUSD",
+        "create_ts": "2024-03-18T08:00:00Z",
+        "symbol": "SOL/USD",
+        "currency": "SOL",
+        "order_action": "buy",
+        "percentage": Decimal('0.6'),
+    }
+    signal = TradeSignal.from_dict(trade)
+
+    assert signal == TradeSignal("SOL/USD", "SOL", "buy", Decimal('0.6'))
+    assert TradeSignal.from_dict({"symbol": "SOL/USD", "currency": "SOL", "order_action": "sell"}).percentage == 0
+
+    with pytest.raises(ValueError, match="Buy trade signal missing 'percentage' attribute."):
+        TradeSignal.from_dict({"symbol": "SOL/USD", "currency": "SOL", "order_action": "buy"})
+
 def test_get_recent_trade_signal(mock_get_dynamodb_table):
     # Mock DynamoDB table and query response
     mock_table = MagicMock()
@@ -125,4 +168,24 @@ def test_get_recent_trade_signal_no_signals(mock_get_dynamodb_table):
         ExpressionAttributeValues={":ticker": ticker, ":cutoff_time": cutoff_time.isoformat()},
         ScanIndexForward=False
     )
-    assert result == []
\ No newline at end of file
+    assert result == []
+
+def test_get_all_recent_signals(mock_active_tickers):
+    cutoff_time = datetime(2024, 3, 18, 16, 0)
+
+    def mock_get_signals(ticker, cutoff_iso, table_name):
+        return [{"ticker": ticker, "create_ts": cutoff_iso}]
+
+    mock_get_ticker_signals = MagicMock(side_effect=mock_get_signals)
+    with patch.multiple(
+        'chalicelib.trade_processing',
+        get_active_strategy_tickers=MagicMock(return_value=mock_active_tickers),
+        get_ticker_recent_signals=mock_get_ticker_signals,
+    ):
+        result = get_all_recent_signals(cutoff_time, "tradesignals")
+
+    mock_get_ticker_signals.assert_any_call("SOLUSDT", "2024-03-18T16:00:00", "tradesignals")
+    assert result == [
+        {"ticker": "BTCUSD", "create_ts": "2024-03-18T16:00:00"},
+        {"ticker": "SOLUSDT", "create_ts": "2024-03-18T16:00:00"},
+    ]
@@ -1,11 +1,35 @@
+import os
 import pytest
 from decimal import Decimal
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
-from chalicelib.utils import DynamoDBManager, get_trade_precedence
+from chalicelib.utils import (
+    BOTO3_SESSION, 
+    DynamoDBManager, 
+    build_symbol_indexes, 
+    convert_floats_to_decimals, 
+    get_env_var, 
+    get_total_allocation_pct, 
+    get_utc_now_rounded, 
+    get_trade_precedence, 
+    load_strategy_config,
+    reload_strategy_config,
+    _dec,
+)
+
+@pytest.fixture(autouse=True)
+def fresh_strategy_config():
+    """
+    Fixture to rebuild the cached strategy config from disk after each test.
+    """
+    yield
+    reload_strategy_config()
 
 @pytest.fixture
 def mock_boto3_resource():
-    with patch('boto3.resource') as mock_resource:
+    with patch.object(BOTO3_SESSION, 'resource') as mock_resource, \
+        patch.object(DynamoDBManager, "_client", None), \
+        patch.dict(DynamoDBManager._tables, clear=True):
         yield mock_resource
 
 @pytest.fixture
@@ -32,8 +56,120 @@ def test_get_table(mock_boto3_resource, dynamo_manager):
     # Assert that the returned table is correct
     assert table == mock_client.Table.return_value
 
+def test_get_table_shared_across_instances(mock_boto3_resource):
+    table = DynamoDBManager().get_table("tradesignals")
+
+    assert DynamoDBManager().get_table("tradesignals") is table
+    mock_boto3_resource.assert_called_once()
+    mock_boto3_resource.return_value.Table.assert_called_once_with("tradesignals")
+
 def test_get_trade_precedence():
     trade_symbols = ["ETH/USD", "BTC/USD"]
     result = get_trade_precedence(trade_symbols)
 
-    assert result == "ETH/USD"
\ No newline at end of file
+    assert result == "ETH/USD"
+
+def test_get_trade_precedence_tie():
+    indexes = ({}, {"SOL/USD": Decimal('0.4'), "ETH/USD": Decimal('0.4'), "BTC/USD": Decimal('0.2')})
+    with patch('chalicelib.utils.build_symbol_indexes', return_value=indexes):
+        assert get_trade_precedence(["SOL/USD", "BTC/USD", "ETH/USD"]) == "SOL/USD"
+        assert get_trade_precedence(["BTC/USD", "ETH/USD", "SOL/USD"]) == "ETH/USD"
+        assert get_trade_precedence([]) is None
+
+def test_get_trade_precedence_single_symbol():
+    with patch('chalicelib.utils.build_symbol_indexes') as mock_build_symbol_indexes:
+        assert get_trade_precedence(["SOL/USD"]) == "SOL/USD"
+
+    mock_build_symbol_indexes.assert_not_called()
+
+def test_build_symbol_indexes():
+    symbol_by_currency, pct_by_symbol = build_symbol_indexes()
+
+    assert symbol_by_currency["SOL"] == "SOL/USD"
+    assert pct_by_symbol["ETH/USD"] == Decimal('0.25')
+
+def test_get_total_allocation_pct():
+    assert get_total_allocation_pct() == Decimal('0.98')
+
+def test_reload_strategy_config():
+    mock_config = {"BTCUSD": {"symbol": "BTC/USD", "currency": "BTC", "percentage": Decimal('0.5')}}
+    with patch('chalicelib.utils.get_strategy_config', return_value=mock_config):
+        reload_strategy_config()
+
+    assert build_symbol_indexes() == ({"BTC": "BTC/USD"}, {"BTC/USD": Decimal('0.5')})
+    assert get_total_allocation_pct() == Decimal('0.5')
+
+    reload_strategy_config()
+    assert get_total_allocation_pct() == Decimal('0.98')
+
+def test_load_strategy_config_cached(tmp_path, monkeypatch):
+    config_path = tmp_path / "strategy_config.json"
+    config_path.write_text('{"BTCUSD": {"symbol": "BTC/USD", "currency": "BTC", "percentage": 0.2}}')
+    monkeypatch.setattr("chalicelib.utils._STRATEGY_CONFIG_STR", str(config_path))
+
+    config = load_strategy_config()
+    assert load_strategy_config() is config
+
+    # Modifying the file invalidates the cache
+    config_path.write_text('{"BTCUSD": {"symbol": "BTC/USD", "currency": "BTC", "percentage": 0.3}}')
+    os.utime(config_path, (0, 0))
+    assert load_strategy_config()["BTCUSD"]["percentage"] == Decimal('0.3')
+
+def test_load_strategy_config_read_only(monkeypatch):
+    monkeypatch.setattr("chalicelib.utils._STRATEGY_CONFIG_READ_ONLY", True)
+    with patch('os.stat') as mock_stat:
+        config = load_strategy_config()
+
+    mock_stat.assert_not_called()
+    assert config["ETHUSD"]["symbol"] == "ETH/USD"
+
+def test_convert_floats_to_decimals():
+    data = {
+        "ticker": "SOLUSD",
+        "order_price": "100.0",
+        "percentage": 0.6,
+        "contracts": 2,
+        "fills": [{"price": 99.5, "amount": "1.5"}, ["0.25", "long"]],
+    }
+    result = convert_floats_to_decimals(data)
+
+    assert result == {
+        "ticker": "SOLUSD",
+        "order_price": Decimal('100.0'),
+        "percentage": Decimal('0.6'),
+        "contracts": 2,
+        "fills": [{"price": Decimal('99.5'), "amount": Decimal('1.5')}, [Decimal('0.25'), "long"]],
+    }
+    assert list(result) == list(data)
+
+def test_dec_keeps_representation():
+    assert str(_dec(0.0)) == "0.0"
+    assert str(_dec(-0.0)) == "-0.0"
+    assert str(_dec("0.2")) == "0.2"
+    assert str(_dec("0.20")) == "0.20"
+
+    value = Decimal('0.20')
+    assert _dec(value) is value
+
+def test_get_env_var(monkeypatch):
+    monkeypatch.setenv("SANDBOX", "True")
+    assert get_env_var("SANDBOX") is True
+
+    monkeypatch.setenv("SANDBOX", "FALSE")
+    assert get_env_var("SANDBOX") is False
+
+    monkeypatch.delenv("SANDBOX")
+    assert get_env_var("SANDBOX", default_value=True) is True
+    with pytest.raises(ValueError, match="not set"):
+        get_env_var("SANDBOX")
+
+    monkeypatch.setenv("SANDBOX", "yes")
+    with pytest.raises(ValueError, match="Invalid value"):
+        get_env_var("SANDBOX")
+
+def test_get_utc_now_rounded():
+    with patch('time.time', return_value=1710788399.75):  # 2024-03-18T18:59:59.75Z
+        result = get_utc_now_rounded()
+
+    assert result == datetime(2024, 3, 18, 18, 0, tzinfo=timezone.utc)
+    assert result.tzinfo == timezone.utc